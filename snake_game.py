@@ -1,8 +1,7 @@
 import pygame
-import sys
 import random # For generating random positions for the food
 import os # For file operations (loading/saving high score)
-from collections import deque # For managing direction changes in the snake
+from collections import deque # For the snake body
 
 class Config:
     # Configuration settings for the game
@@ -10,8 +9,11 @@ class Config:
     SCREEN_HEIGHT = 600
     SNAKE_SIZE = 20 # Size of each snake segment
     FOOD_SIZE = 20 # Size of food
-    FPS = 20 # Frames per second (controls game speed - higher FPS the faster snake moves)
+    FPS = 20 # Game updates per second (controls game speed - higher FPS the faster snake moves)
+    RENDER_FPS = 60 # Frames drawn per second (doesnt affect game speed)
     HIGH_SCORE_FILE = "highscore.txt" # File to store the high score
+    GRID_WIDTH = SCREEN_WIDTH // SNAKE_SIZE # Number of cells across the screen
+    GRID_HEIGHT = SCREEN_HEIGHT // SNAKE_SIZE # Number of cells down the screen
 
     # Colors
     BLACK = (0, 0, 0) # Background color
@@ -23,172 +25,360 @@ class Config:
     FONT_SIZE = 36 # Regular font size for text
     FONT_TITLE_SIZE = 72 # Larger font size for titles
 
+    # Directions the snake can move in (one grid cell per move)
+    UP = (0, -1)
+    DOWN = (0, 1)
+    LEFT = (-1, 0)
+    RIGHT = (1, 0)
+
+    # Controls (w/up, s/down, a/left, d/right) mapped to the direction they turn the snake
+    KEY_DIRECTIONS = {
+        pygame.K_w: UP, pygame.K_UP: UP,
+        pygame.K_s: DOWN, pygame.K_DOWN: DOWN,
+        pygame.K_a: LEFT, pygame.K_LEFT: LEFT,
+        pygame.K_d: RIGHT, pygame.K_RIGHT: RIGHT,
+    }
+
+    # Event types the game handles (everything else is blocked at startup)
+    EVENT_TYPES = (pygame.QUIT, pygame.KEYDOWN, pygame.VIDEOEXPOSE)
+
+# Module-level copies of the settings used every frame (a plain global lookup instead of Config.<name>)
+SNAKE_SIZE = Config.SNAKE_SIZE
+GRID_WIDTH = Config.GRID_WIDTH
+GRID_HEIGHT = Config.GRID_HEIGHT
+LAST_COLUMN = GRID_WIDTH - 1
+LAST_ROW = GRID_HEIGHT - 1
+BLACK = Config.BLACK
+KEY_DIRECTIONS = Config.KEY_DIRECTIONS
+EVENT_TYPES = Config.EVENT_TYPES
+
+def cell_index(position):
+    # Pack a grid position into a single int index of its cell
+    return position[0] * GRID_HEIGHT + position[1]
+
+def cell_position(key):
+    # Unpack a cell index back into its grid position
+    return divmod(key, GRID_HEIGHT)
+
 class Snake:
+    # Fixed attribute slots (no per-instance __dict__, faster attribute access)
+    __slots__ = ("body", "direction", "next_direction", "queued_direction", "growing", "occupied", "free_cells",
+                 "free_index", "self_collision", "removed_tail", "cell")
+
     def __init__(self):
         # Initialize the snake with a single segment at the center of the screen
-        self.body = [pygame.Vector2(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT // 2)]
-        self.direction = pygame.Vector2(Config.SNAKE_SIZE, 0) # Initial direction: right
-        self.next_direction = deque() # Queue to store pending direction changes
+        # Positions and directions are (x, y) int tuples in grid cells, only scaled to pixels when drawing
+        self.body = deque([(Config.GRID_WIDTH // 2, Config.GRID_HEIGHT // 2)]) # Deque gives O(1) head insertion
+        self.direction = Config.RIGHT # Initial direction
+        self.next_direction = None # Pending direction change applied on the next move
+        self.queued_direction = None # Second pending direction change, applied on the move after that
         self.growing = False # Flag to indicate if the snake should grow
+        self.occupied = bytearray(Config.GRID_WIDTH * Config.GRID_HEIGHT) # 1 for each grid cell covered by the snake
+        self.free_cells = list(range(Config.GRID_WIDTH * Config.GRID_HEIGHT)) # Cells not covered by the snake (for O(1) food placement)
+        self.free_index = list(range(Config.GRID_WIDTH * Config.GRID_HEIGHT)) # Position of each cell in free_cells
+        self.occupy(cell_index(self.body[0]))
+        self.self_collision = False # Flag set by move() when the head runs into the body
+        self.removed_tail = None # Position of the tail segment removed by the last move (None if the snake grew)
+
+        # Pre-filled surface for one segment, so the whole body can be drawn with a single blits call
+        # (converted to the display's pixel format so blitting it is a plain copy)
+        self.cell = pygame.Surface((Config.SNAKE_SIZE, Config.SNAKE_SIZE)).convert()
+        self.cell.fill(Config.GREEN)
 
     def move(self):
         # Update the snakes direction from the queue (if there are pending changes)
-        if self.next_direction:
-            next_direction = self.next_direction.popleft()
-            # Prevent the snake from reversing direction
-            if next_direction.x != -self.direction.x and next_direction.y != -self.direction.y:
-                self.direction = next_direction
+        if self.next_direction is not None:
+            self.direction = self.next_direction
+            self.next_direction = self.queued_direction
+            self.queued_direction = None
 
         # Move the snake by adding a new head segment in the current direction
-        new_head = self.body[0] + self.direction
-        self.body.insert(0 , new_head)
+        x, y = self.body[0]
+        dx, dy = self.direction
+        x += dx
+        y += dy
+        new_head = (x, y)
+        self.body.appendleft(new_head)
 
         # Remove the tail segment unless the snake is growing
+        # (done before the self-collision test, since the tail frees its cell)
         if not self.growing:
-            self.body.pop()
+            self.removed_tail = self.body.pop()
+            self.release(cell_index(self.removed_tail))
         else:
+            self.removed_tail = None
             self.growing = False # Reset the growing flag
 
+        # Check for collisions with itself and mark the new head cell as occupied
+        # (a head outside the grid has no cell, check_collision reports it as a wall hit)
+        if (x | y | (LAST_COLUMN - x) | (LAST_ROW - y)) >= 0:
+            key = x * GRID_HEIGHT + y # Same as cell_index(new_head)
+            self.self_collision = self.occupied[key] == 1
+            if not self.self_collision:
+                self.occupy(key)
+
+    def queue_direction(self, direction):
+        # Queue a direction change (at most two pending), dropping turns that would reverse the snake
+        # or keep it going the same way, so they never take up a slot
+        if self.queued_direction is not None:
+            return
+        last = self.direction if self.next_direction is None else self.next_direction
+        if direction == last or direction == (-last[0], -last[1]):
+            return
+        if self.next_direction is None:
+            self.next_direction = direction
+        else:
+            self.queued_direction = direction
+
+    def occupy(self, key):
+        # Mark a cell as covered and remove it from the free list by swapping in the last free cell
+        self.occupied[key] = 1
+        index = self.free_index[key]
+        last = self.free_cells.pop()
+        if last != key:
+            self.free_cells[index] = last
+            self.free_index[last] = index
+
+    def release(self, key):
+        # Mark a cell as free again and append it to the free list
+        self.occupied[key] = 0
+        self.free_index[key] = len(self.free_cells)
+        self.free_cells.append(key)
+
     def grow(self):
         # Set the growing flag to True so the snake grows when it moves
         self.growing = True
 
     def check_collision(self):
         # Check for collisions with the walls
-        if (self.body[0].x < 0 or self.body[0].x >= Config.SCREEN_WIDTH 
-            or
-            self.body[0].y < 0 or self.body[0].y >= Config.SCREEN_HEIGHT):
-            return True
-        # Check for collisions with itself
-        if self.body[0] in self.body[1:]:
+        # (OR-ing the distances to each edge is only negative if one of them is, i.e. the head is off the grid)
+        x, y = self.body[0]
+        if (x | y | (LAST_COLUMN - x) | (LAST_ROW - y)) < 0:
             return True
-
-        return False
+        # Collisions with itself are detected in move()
+        return self.self_collision
 
     def draw(self, screen):
-        # Draw each segment of the snake
-        for segment in self.body:
-            pygame.draw.rect(screen, (Config.GREEN), pygame.Rect(segment.x, segment.y, Config.SNAKE_SIZE, Config.SNAKE_SIZE))
+        # Draw every segment of the snake in one call
+        cell = self.cell
+        screen.blits([(cell, (x * SNAKE_SIZE, y * SNAKE_SIZE)) for x, y in self.body], False)
 
 class Food:
-    def __init__(self, snake_body):
+    __slots__ = ("position", "surface")
+
+    def __init__(self, free_cells):
         # Initialize the food with a random position that doesnt overlap with the snake
-        self.position = self.generate_position(snake_body)
-
-    def generate_position(self, snake_body):
-        # Generate a random position for the food that doesnt overlap with the snake
-        while True:
-            position = pygame.Vector2(
-                random.randint(0, (Config.SCREEN_WIDTH - Config.FOOD_SIZE) // Config.FOOD_SIZE) * Config.FOOD_SIZE,
-                random.randint(0 , (Config.SCREEN_HEIGHT - Config.FOOD_SIZE) // Config.FOOD_SIZE) * Config.FOOD_SIZE
-            )
-            if position not in snake_body:
-                return position
+        self.position = self.generate_position(free_cells)
+        self.surface = pygame.Surface((Config.FOOD_SIZE, Config.FOOD_SIZE)).convert() # Pre-filled food surface
+        self.surface.fill(Config.RED)
+
+    def generate_position(self, free_cells):
+        # Pick a random cell that isnt covered by the snake (constant time, no retries)
+        return cell_position(random.choice(free_cells))
             
-    def respawn(self, snake_body):
+    def respawn(self, free_cells):
         # Respawn the food at a new random position
-        self.position = self.generate_position(snake_body)
+        self.position = self.generate_position(free_cells)
     
     def draw(self, screen):
         # Draw the food on the screen
-        pygame.draw.rect(screen, Config.RED, (self.position.x, self.position.y, Config.FOOD_SIZE, Config.FOOD_SIZE))
+        screen.blit(self.surface, (self.position[0] * SNAKE_SIZE, self.position[1] * SNAKE_SIZE))
 
 class GameManager:
+    __slots__ = ("snake", "food", "score", "high_score", "game_over", "paused", "game_state", "redraw", "dirty_cells",
+                 "_font", "_title_font", "_title_surf", "_start_surf", "_quit_surf", "_paused_surf", "_game_over_surf",
+                 "_title_pos", "_start_pos", "_quit_pos", "_paused_pos", "_game_over_pos", "_score_surf", "_score_rect", "_score_cached",
+                 "_hs_surf", "_hs_rect", "_hs_cached")
+
     def __init__(self):
         # Initialize the game manager with a snake, food, score
         self.snake = Snake()
-        self.food = Food(self.snake.body)
+        self.food = Food(self.snake.free_cells)
         self.score = 0
         self.high_score = self.load_high_score()
         self.game_over = False
         self.paused = False
         self.game_state = "start" # Initial game state (start menu)
-        
+        self.redraw = True # Flag to repaint the whole screen on the next draw (set on state changes)
+        self.dirty_cells = [] # Grid cells changed since the last draw (only these get repainted)
+
+        # Create the fonts once instead of every frame
+        self._font = pygame.font.Font(None, Config.FONT_SIZE)
+        self._title_font = pygame.font.Font(None, Config.FONT_TITLE_SIZE)
+
+        # Pre-render the text that never changes
+        # (text is converted to the display's pixel format, keeping its alpha for the antialiased edges)
+        self._title_surf = self._title_font.render("Snake Game", True, Config.GREEN).convert_alpha()
+        self._start_surf = self._font.render("Press SPACE to Start", True, Config.WHITE).convert_alpha()
+        self._quit_surf = self._font.render("Press Q to Quit", True, Config.WHITE).convert_alpha()
+        self._paused_surf = self._font.render("Paused! Press P to Resume", True, Config.WHITE).convert_alpha()
+        self._game_over_surf = self._font.render("Game over! Press R to Restart or Q to go to Menu", True, Config.WHITE).convert_alpha()
+
+        # Work out where the static text goes (centered horizontally) once
+        self._title_pos = (Config.SCREEN_WIDTH // 2 - self._title_surf.get_width() // 2, 100)
+        self._start_pos = (Config.SCREEN_WIDTH // 2 - self._start_surf.get_width() // 2, 300)
+        self._quit_pos = (Config.SCREEN_WIDTH // 2 - self._quit_surf.get_width() // 2, 350)
+        self._paused_pos = (Config.SCREEN_WIDTH // 2 - self._paused_surf.get_width() // 2, Config.SCREEN_HEIGHT // 2)
+        self._game_over_pos = (Config.SCREEN_WIDTH // 2 - self._game_over_surf.get_width() // 2, Config.SCREEN_HEIGHT // 2)
+
+        # Score and high score surfaces are re-rendered only when their value changes
+        # (their screen rects are kept too, so draw_dirty_cells doesnt build new ones every frame)
+        self._score_surf = None
+        self._score_rect = None
+        self._score_cached = -1
+        self._hs_surf = None
+        self._hs_rect = None
+        self._hs_cached = -1
+
     def reset_game(self):
         # Reset the game to its initial state
         self.snake = Snake()
-        self.food = Food(self.snake.body)
+        self.food = Food(self.snake.free_cells)
         self.score = 0
         self.game_over = False
+        self.redraw = True
 
     def load_high_score(self):
-        # Load the high score from a file
-        if os.path.exists(Config.HIGH_SCORE_FILE):
-            with open(Config.HIGH_SCORE_FILE, "r") as file:
-                content = file.read().strip()
-                if content.isdigit():
-                    return int(content)
+        # Load the high score from a file (one small unbuffered read, no separate existence check)
+        try:
+            fd = os.open(Config.HIGH_SCORE_FILE, os.O_RDONLY)
+        except FileNotFoundError:
+            return 0
+        try:
+            content = os.read(fd, 16).strip()
+        finally:
+            os.close(fd)
+        if content.isdigit():
+            return int(content)
         return 0
     
     def save_high_score(self):
-        # Save the high score to a file
-        with open(Config.HIGH_SCORE_FILE, "w") as file:
-            file.write(str(self.high_score))
+        # Save the high score to a file (a single unbuffered write, only called on a new record)
+        fd = os.open(Config.HIGH_SCORE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, str(self.high_score).encode())
+        finally:
+            os.close(fd)
 
     def update(self):
         # Update the game state (move the snake, check for collisions)
         if self.game_state == "playing" and not self.paused and not self.game_over:
             self.snake.move()
 
-            # Check if the snake has eaten the food
-            if self.snake.body[0] == self.food.position:
-                self.food.respawn(self.snake.body)
+            # Remember the cells that changed so draw() only repaints those
+            head = self.snake.body[0]
+            if self.snake.removed_tail is not None:
+                self.dirty_cells.append(self.snake.removed_tail)
+            self.dirty_cells.append(head)
+
+            # Check if the snake has eaten the food (plain int tuple compare)
+            if head == self.food.position:
                 self.snake.grow()
                 self.score += 1
+                if not self.snake.free_cells:
+                    # The snake covers the whole board, so there is nowhere left to put food
+                    self.end_game()
+                    return
+                self.food.respawn(self.snake.free_cells)
+                self.dirty_cells.append(self.food.position)
 
             # Check for collisions (game over if collision)
             if self.snake.check_collision():
-                self.game_over = True
-                if self.score > self.high_score:
-                    self.high_score = self.score
-                    self.save_high_score()
+                self.end_game()
+
+    def end_game(self):
+        # End the round and save the high score if it was beaten
+        self.game_over = True
+        self.redraw = True
+        if self.score > self.high_score:
+            self.high_score = self.score
+            self.save_high_score()
 
     def draw(self, screen):
-        # Draw the current game state (start menu, playing, game over)
-        screen.fill(Config.BLACK)
+        # Draw the current game state, repainting only what changed since the last frame
+        if not self.redraw and self.game_state == "playing" and self.dirty_cells:
+            self.draw_dirty_cells(screen)
+        elif self.redraw:
+            self.draw_full(screen)
+
+    def draw_dirty_cells(self, screen):
+        # Repaint just the changed cells and push only those rects to the display
+        cells = self.dirty_cells
+        self.dirty_cells = []
+        dirty = [pygame.Rect(x * SNAKE_SIZE, y * SNAKE_SIZE, SNAKE_SIZE, SNAKE_SIZE) for x, y in cells]
+
+        # Cells under the score text would overwrite it, so fall back to a full repaint there
+        if (self.score != self._score_cached
+                or self._score_rect.collidelist(dirty) != -1
+                or self._hs_rect.collidelist(dirty) != -1):
+            self.draw_full(screen)
+            return
+
+        occupied = self.snake.occupied
+        for cell, rect in zip(cells, dirty):
+            screen.fill(BLACK, rect)
+            if occupied[cell_index(cell)]:
+                screen.blit(self.snake.cell, rect)
+            elif cell == self.food.position:
+                self.food.draw(screen)
+        pygame.display.update(dirty)
+
+    def draw_full(self, screen):
+        # Repaint the whole screen (start menu, playing, game over)
+        self.redraw = False
+        self.dirty_cells.clear()
+        screen.fill(BLACK)
 
         if self.game_state == "start":
             # Draw the start menu
-            font = pygame.font.Font(None, Config.FONT_TITLE_SIZE)
-            title_text = font.render("Snake Game", True, Config.GREEN)
-            screen.blit(title_text, (Config.SCREEN_WIDTH // 2 - title_text.get_width() // 2, 100))
-
-            font = pygame.font.Font(None, Config.FONT_SIZE)
-            start_text = font.render("Press SPACE to Start", True, Config.WHITE)
-            screen.blit(start_text, (Config.SCREEN_WIDTH // 2 - start_text.get_width() // 2, 300))
-            quit_text = font.render("Press Q to Quit", True, Config.WHITE)
-            screen.blit(quit_text, (Config.SCREEN_WIDTH // 2 - quit_text.get_width() // 2, 350))
+            screen.blit(self._title_surf, self._title_pos)
+            screen.blit(self._start_surf, self._start_pos)
+            screen.blit(self._quit_surf, self._quit_pos)
         
         elif self.game_state == "playing":
-            # Draw the snake and food
-            self.snake.draw(screen)
+            # Draw the food and snake (snake last, so eaten food left under a full board's head stays hidden)
             self.food.draw(screen)
+            self.snake.draw(screen)
+
+            # Re-render the score and high score only if they changed
+            if self.score != self._score_cached:
+                self._score_surf = self._font.render(f"Score: {self.score}", True, Config.WHITE).convert_alpha()
+                self._score_rect = self._score_surf.get_rect(topleft=(10, 10))
+                self._score_cached = self.score
+            if self.high_score != self._hs_cached:
+                self._hs_surf = self._font.render(f"High Score: {self.high_score}", True, Config.WHITE).convert_alpha()
+                self._hs_rect = self._hs_surf.get_rect(topleft=(10, 50))
+                self._hs_cached = self.high_score
 
             # Draw the score and high score
-            font = pygame.font.Font(None, Config.FONT_SIZE)
-            score_text = font.render(f"Score: {self.score}", True, Config.WHITE)
-            high_score_text = font.render(f"High Score: {self.high_score}", True, Config.WHITE)
-            screen.blit(score_text, (10, 10))
-            screen.blit(high_score_text, (10, 50))
+            screen.blit(self._score_surf, self._score_rect)
+            screen.blit(self._hs_surf, self._hs_rect)
 
             # Draw the message when paused
             if self.paused:
-                paused_text = font.render("Paused! Press P to Resume", True, Config.WHITE)
-                screen.blit(paused_text, (Config.SCREEN_WIDTH // 2 - paused_text.get_width() // 2, Config.SCREEN_HEIGHT // 2))
+                screen.blit(self._paused_surf, self._paused_pos)
 
             # Draw the message when game over
             if self.game_over:
-                game_over_text = font.render("Game over! Press R to Restart or Q to go to Menu", True, Config.WHITE)
-                screen.blit(game_over_text, (Config.SCREEN_WIDTH // 2 - game_over_text.get_width() // 2, Config.SCREEN_HEIGHT // 2))
+                screen.blit(self._game_over_surf, self._game_over_pos)
 
         pygame.display.flip()
 
 
     def handle_events(self):
         # Handle user inputs (keyboard events)
-        for event in pygame.event.get():
+        if not self.redraw and (self.game_state != "playing" or self.paused or self.game_over):
+            # Nothing moves on the menu, pause or game over screens, so sleep until the next event
+            events = [pygame.event.wait()] + pygame.event.get(EVENT_TYPES)
+        else:
+            events = pygame.event.get(EVENT_TYPES)
+
+        for event in events:
             if event.type == pygame.QUIT:
                 return False
+
+            if event.type == pygame.VIDEOEXPOSE: # Window contents were lost (e.g. restored from minimized)
+                self.redraw = True
             
             if event.type == pygame.KEYDOWN:
                 if self.game_state == "start": # Start menu controlls
@@ -205,23 +395,16 @@ class GameManager:
                             self.game_state = "playing"
                         elif event.key == pygame.K_q: # Back to menu
                             self.game_state = "start"
+                            self.redraw = True
                     elif event.key == pygame.K_p: # Pause the game
                         self.paused = not self.paused
+                        self.redraw = True
                     else:
                         if not self.paused:
-                            # Handle direction changes (w/up, s/down, a/left, d/right)
-                            if event.key == pygame.K_w or event.key == pygame.K_UP:
-                                if len(self.snake.next_direction) < 2:
-                                    self.snake.next_direction.append(pygame.Vector2(0, -Config.SNAKE_SIZE))
-                            elif event.key == pygame.K_s or event.key == pygame.K_DOWN:
-                                if len(self.snake.next_direction) < 2:
-                                    self.snake.next_direction.append(pygame.Vector2(0, Config.SNAKE_SIZE))
-                            elif event.key == pygame.K_a or event.key == pygame.K_LEFT:
-                                if len(self.snake.next_direction) < 2:
-                                    self.snake.next_direction.append(pygame.Vector2(-Config.SNAKE_SIZE, 0))
-                            elif event.key == pygame.K_d or event.key == pygame.K_RIGHT:
-                                if len(self.snake.next_direction) < 2:
-                                    self.snake.next_direction.append(pygame.Vector2(Config.SNAKE_SIZE, 0))
+                            # Handle direction changes with a single lookup
+                            direction = KEY_DIRECTIONS.get(event.key)
+                            if direction is not None:
+                                self.snake.queue_direction(direction)
         return True
 
 # Initalize Pygame
@@ -231,19 +414,38 @@ pygame.init()
 screen = pygame.display.set_mode((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
 pygame.display.set_caption("Snake Game")
 
+# Only let the events the game handles into the queue
+pygame.event.set_blocked(None)
+pygame.event.set_allowed(Config.EVENT_TYPES)
+
 # Initialize the game clock and game manager
 clock = pygame.time.Clock()
 game_manager = GameManager()
 
+# Look up the per-frame methods once instead of on every loop iteration
+handle_events = game_manager.handle_events
+update = game_manager.update
+draw = game_manager.draw
+tick = clock.tick
+render_fps = Config.RENDER_FPS
+step = 1000 / Config.FPS # Milliseconds between game updates
+
 # Main game loop
 running = True
+lag = 0.0 # Time not yet simulated by update()
 while running:
-    running = game_manager.handle_events()
-    game_manager.update()
-    game_manager.draw(screen)
-    pygame.display.flip()
-    clock.tick(Config.FPS)
+    running = handle_events()
+
+    # Update the game at a fixed rate, independent of how often frames are drawn
+    while lag >= step:
+        update()
+        lag -= step
+
+    draw(screen) # Presents the frame itself (flip or dirty-rect update)
+
+    # A long frame (e.g. waiting for input while paused) counts as at most one update
+    lag += min(tick(render_fps), step)
 
 # Quit pygame and exit the program
 pygame.quit()
-sys.exit()
\ No newline at end of file
+raise SystemExit
\ No newline at end of file